@@ -1,5 +1,7 @@
+import array
 import sys
 import random
+import time
 from PySide6.QtWidgets import (
     QApplication,
     QDialog,
@@ -14,8 +16,16 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from PySide6.QtCore import QPoint, Qt, QTimer, Signal, Slot
-from PySide6.QtGui import QBrush, QColor, QKeySequence, QPainter, QPen
+from PySide6.QtCore import QRect, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QKeySequence,
+    QPainter,
+    QPen,
+    QPixmap,
+    QRegion,
+)
 
 BOARD_WIDTH_BLOCKS = 10
 BOARD_HEIGHT_BLOCKS = 22
@@ -31,6 +41,15 @@ TETRIS_SHAPES = (  # Defines the 7 Tetris pieces (coords relative to a pivot)
     ((0, 0), (1, 0), (0, 1), (-1, 1)),  # S-shape - Index 6
     ((0, 0), (-1, 0), (0, 1), (1, 1)),  # Z-shape - Index 7
 )
+SHAPE_BBOX = tuple(  # (min_x, max_x, min_y, max_y) of each shape's coords
+    (
+        min(p[0] for p in shape),
+        max(p[0] for p in shape),
+        min(p[1] for p in shape),
+        max(p[1] for p in shape),
+    )
+    for shape in TETRIS_SHAPES
+)
 TETRIS_COLORS = (  # Neon-style Colors (fully opaque - alpha 255)
     QColor(255, 255, 51),  # Bright Yellow (O)
     QColor(51, 255, 255),  # Bright Cyan (I)
@@ -40,20 +59,199 @@ TETRIS_COLORS = (  # Neon-style Colors (fully opaque - alpha 255)
     QColor(102, 255, 51),  # Bright Green (S)
     QColor(255, 51, 51),  # Bright Red (Z)
 )
+# Fill brushes and border pens per color, built once instead of per draw call
+TETRIS_BORDER_COLORS = tuple(color.darker(120) for color in TETRIS_COLORS)
+TETRIS_BRUSHES = tuple(QBrush(color) for color in TETRIS_COLORS)
+TETRIS_BORDER_PENS = tuple(QPen(color) for color in TETRIS_BORDER_COLORS)
+TETRIS_SHADOW_PENS = tuple(QPen(color.darker(110), 1) for color in TETRIS_COLORS)
+BOARD_BACKGROUND_COLOR = QColor("#1C1C1C")  # Dark grey board background
+BOARD_BORDER_PEN = QPen(QColor("#444444"))  # Slightly lighter board border
+PREVIEW_BACKGROUND_COLOR = QColor("lightgrey")  # Next piece box background
+PREVIEW_BORDER_PEN = QPen(QColor("black"))  # Next piece box border
 NO_BLOCK = 0
+FULL_ROW_MASK = (1 << BOARD_WIDTH_BLOCKS) - 1  # Row bitmask with every column set
+EMPTY_BOARD_STATE = bytes(BOARD_WIDTH_BLOCKS * BOARD_HEIGHT_BLOCKS)  # For resets
 NEXT_PIECE_AREA_WIDTH_BLOCKS = 4  # How many blocks wide the next piece area is
 NEXT_PIECE_AREA_HEIGHT_BLOCKS = 4  # How many blocks high
+FRAME_INTERVAL_MS = 16  # Game loop tick; gravity runs off elapsed time instead
+DEBUG_TRACE = False  # Print trace messages; python -O drops them entirely
+
+
+def _shape_rotations(shape_coords):
+    """Returns the distinct orientations of a shape, rotating (x, y) -> (-y, x).
+
+    Orientations that only differ by a translation are dropped, so the Square
+    keeps 1 entry, I/S/Z keep 2 and the rest keep 4.
+    """
+    rotations = []
+    seen = set()
+    for _ in range(4):
+        min_x = min(p[0] for p in shape_coords)
+        min_y = min(p[1] for p in shape_coords)
+        normalized = frozenset((x - min_x, y - min_y) for x, y in shape_coords)
+        if normalized in seen:
+            break
+        seen.add(normalized)
+        rotations.append(tuple(shape_coords))
+        shape_coords = tuple((-y, x) for x, y in shape_coords)
+    return tuple(rotations)
+
+
+def _row_masks_by_origin_x(rotation_coords):
+    """Returns, for each board column, the (dy, bitmask) rows of a rotation.
+
+    An entry is None when the piece would stick out of the board at that x.
+    """
+    masks_by_x = []
+    for origin_x in range(BOARD_WIDTH_BLOCKS):
+        rows = {}
+        for dx, dy in rotation_coords:
+            x = origin_x + dx
+            if not 0 <= x < BOARD_WIDTH_BLOCKS:
+                rows = None
+                break
+            rows[dy] = rows.get(dy, 0) | (1 << x)
+        masks_by_x.append(None if rows is None else tuple(sorted(rows.items())))
+    return tuple(masks_by_x)
+
+
+def _bottom_offsets(rotation_coords):
+    """Returns (dx, lowest dy) for each column a rotation occupies."""
+    bottoms = {}
+    for dx, dy in rotation_coords:
+        bottoms[dx] = max(bottoms.get(dx, dy), dy)
+    return tuple(sorted(bottoms.items()))
+
+
+def _pixel_bounds(rotation_coords):
+    """Returns the pixel bounding box of a rotation with its pivot at (0, 0)."""
+    min_dx = min(dx for dx, _ in rotation_coords)
+    max_dx = max(dx for dx, _ in rotation_coords)
+    min_dy = min(dy for _, dy in rotation_coords)
+    max_dy = max(dy for _, dy in rotation_coords)
+    # Grown by a pixel so the block outline pens are always covered
+    return QRect(
+        min_dx * BLOCK_SIZE_PX,
+        min_dy * BLOCK_SIZE_PX,
+        (max_dx - min_dx + 1) * BLOCK_SIZE_PX,
+        (max_dy - min_dy + 1) * BLOCK_SIZE_PX,
+    ).adjusted(-1, -1, 1, 1)
+
+
+# PIECE_ROTATIONS[shape_index - 1][rotation] -> ((dx, dy), ...) around the pivot
+PIECE_ROTATIONS = tuple(_shape_rotations(shape) for shape in TETRIS_SHAPES)
+# PIECE_ROW_MASKS[shape_index - 1][rotation][origin_x] -> ((dy, mask), ...) or None
+PIECE_ROW_MASKS = tuple(
+    tuple(_row_masks_by_origin_x(rotation) for rotation in rotations)
+    for rotations in PIECE_ROTATIONS
+)
+# PIECE_PIXEL_BOUNDS[shape_index - 1][rotation] -> QRect around a pivot at (0, 0)
+PIECE_PIXEL_BOUNDS = tuple(
+    tuple(_pixel_bounds(rotation) for rotation in rotations)
+    for rotations in PIECE_ROTATIONS
+)
+# PIECE_BOTTOM_OFFSETS[shape_index - 1][rotation] -> ((dx, lowest dy), ...)
+PIECE_BOTTOM_OFFSETS = tuple(
+    tuple(_bottom_offsets(rotation) for rotation in rotations)
+    for rotations in PIECE_ROTATIONS
+)
+
+
+# Wall kicks: (dx, dy) pivot shifts tried in order when a rotation is blocked.
+# Pivots here sit on a cell rather than at SRS's centres, and I/S/Z have only
+# two orientations, so the SRS tables don't line up with PIECE_ROTATIONS; a
+# short symmetric list suits this pivot system in either direction instead.
+KICKS = ((0, 0), (-1, 0), (1, 0), (0, -1))
+KICKS_I = ((0, 0), (-1, 0), (1, 0), (-2, 0), (2, 0), (0, -1))  # Spans 4 columns
+# PIECE_KICKS[shape_index - 1] -> kick list for that shape (I is index 2)
+PIECE_KICKS = tuple(
+    KICKS_I if shape_index == 2 else KICKS
+    for shape_index in range(1, len(TETRIS_SHAPES) + 1)
+)
+
+
+# Board kernels: plain ints and lists only, no Qt, so GameBoard stays a thin shim
+def _piece_rows_fit(row_masks, piece_rows, y):
+    """Returns True if the (dy, mask) piece rows at row y hit no filled cell."""
+    # piece_rows is sorted by dy, so its ends bound the piece vertically
+    if y + piece_rows[0][0] < 0 or y + piece_rows[-1][0] >= BOARD_HEIGHT_BLOCKS:
+        return False
+    for dy, mask in piece_rows:
+        if mask & row_masks[y + dy]:
+            return False
+    return True
+
+
+def _drop_distance(row_masks, piece_rows, y):
+    """Returns how many rows the piece rows at row y can fall before landing."""
+    lowest_y = BOARD_HEIGHT_BLOCKS - 1 - piece_rows[-1][0]
+    start_y = y
+    while y < lowest_y:
+        for dy, mask in piece_rows:
+            if mask & row_masks[y + 1 + dy]:
+                return y - start_y
+        y += 1
+    return y - start_y
+
+
+def _drop_full_rows(row_masks, board_state, num_cleared, top_y=0):
+    """Removes the num_cleared full rows in place, adding empty rows on top.
+
+    Full rows are found with row_masks.index, a C-level compare against
+    FULL_ROW_MASK, starting at top_y as no row above it is full. Adjacent
+    full rows are cut out as one run, so a Tetris moves the board once
+    instead of four times. Runs are handled top down, so deleting one never
+    moves a full row that is still waiting below it.
+    """
+    y = top_y
+    while num_cleared:
+        y = row_masks.index(FULL_ROW_MASK, y)
+        run = 1
+        while run < num_cleared and row_masks[y + run] == FULL_ROW_MASK:
+            run += 1
+        del row_masks[y : y + run]
+        row_masks[0:0] = array.array("H", [0]) * run
+        del board_state[y * BOARD_WIDTH_BLOCKS : (y + run) * BOARD_WIDTH_BLOCKS]
+        board_state[0:0] = bytes(run * BOARD_WIDTH_BLOCKS)
+        y += run
+        num_cleared -= run
+
+
+_KEY_STRING_CACHE = {}  # Key code -> display text, filled by _key_to_str
+
+
+def _key_to_str(qt_key_code):
+    """Returns the display text for a key code, formatting each code once."""
+    key_str = _KEY_STRING_CACHE.get(qt_key_code)
+    if key_str is not None:
+        return key_str
+    key_sequence = QKeySequence(qt_key_code)
+    key_str = key_sequence.toString(QKeySequence.SequenceFormat.NativeText)
+    # Optional: Handle cases where NativeText might still be empty for some obscure keys
+    if not key_str:
+        # Fallback to portable text or just the key code if needed
+        key_str = key_sequence.toString(QKeySequence.SequenceFormat.PortableText)
+        if not key_str:
+            key_str = f"Code: {qt_key_code}"  # Absolute fallback
+    _KEY_STRING_CACHE[qt_key_code] = key_str
+    return key_str
 
 
 class NextPieceWidget(QFrame):
     """Widget to display the upcoming Tetris piece."""
 
+    # Rendered preview per (shape index, device pixel ratio), -1 for the empty
+    # box; keyed by ratio too so moving to another screen renders it afresh
+    _pixmap_cache = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         width = NEXT_PIECE_AREA_WIDTH_BLOCKS * BLOCK_SIZE_PX + 10
         height = NEXT_PIECE_AREA_HEIGHT_BLOCKS * BLOCK_SIZE_PX + 10
         self.setFixedSize(width, height)
-        self.setStyleSheet("background-color: lightgrey; border: 1px solid black;")
+        # The cached pixmaps carry the background and border, so a repaint
+        # is one blit with nothing to clear first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
         self.next_piece_index = -1  # Index (1-7) of the piece to draw, -1 for none
 
     @Slot(int)
@@ -65,22 +263,22 @@ class NextPieceWidget(QFrame):
             self.next_piece_index = -1
         self.update()
 
-    def paintEvent(self, event):
-        """Draws the specified next piece, centered."""
-        super().paintEvent(event)
-        if self.next_piece_index == -1:
-            return
+    def _render_piece(self, shape_index, ratio):
+        """Draws the preview box with a piece centered in it, -1 for none."""
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(PREVIEW_BACKGROUND_COLOR)
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter = QPainter(pixmap)
+        painter.setPen(PREVIEW_BORDER_PEN)
+        painter.drawRect(0, 0, self.width() - 1, self.height() - 1)
+        if shape_index == -1:
+            painter.end()
+            return pixmap
 
-        shape_coords_rel = TETRIS_SHAPES[self.next_piece_index - 1]
-        color = TETRIS_COLORS[self.next_piece_index - 1]
+        shape_coords_rel = TETRIS_SHAPES[shape_index - 1]
 
-        min_x = min(p[0] for p in shape_coords_rel)
-        max_x = max(p[0] for p in shape_coords_rel)
-        min_y = min(p[1] for p in shape_coords_rel)
-        max_y = max(p[1] for p in shape_coords_rel)
+        min_x, max_x, min_y, max_y = SHAPE_BBOX[shape_index - 1]
         piece_width_blocks = max_x - min_x + 1
         piece_height_blocks = max_y - min_y + 1
 
@@ -90,35 +288,65 @@ class NextPieceWidget(QFrame):
         offset_x_px = -min_x * BLOCK_SIZE_PX
         offset_y_px = -min_y * BLOCK_SIZE_PX
 
-        painter.setPen(color.darker(120))
-        painter.setBrush(QBrush(color))
+        painter.setPen(TETRIS_BORDER_PENS[shape_index - 1])
+        painter.setBrush(TETRIS_BRUSHES[shape_index - 1])
 
-        for point_offset in shape_coords_rel:
-            rect_x = start_x_px + offset_x_px + point_offset[0] * BLOCK_SIZE_PX
-            rect_y = start_y_px + offset_y_px + point_offset[1] * BLOCK_SIZE_PX
-            painter.drawRect(rect_x, rect_y, BLOCK_SIZE_PX - 1, BLOCK_SIZE_PX - 1)
+        painter.drawRects(
+            [
+                QRect(
+                    start_x_px + offset_x_px + point_offset[0] * BLOCK_SIZE_PX,
+                    start_y_px + offset_y_px + point_offset[1] * BLOCK_SIZE_PX,
+                    BLOCK_SIZE_PX - 1,
+                    BLOCK_SIZE_PX - 1,
+                )
+                for point_offset in shape_coords_rel
+            ]
+        )
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        """Blits the cached rendering of the next piece, drawing it if new."""
+        ratio = self.devicePixelRatioF()
+        key = (self.next_piece_index, ratio)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = self._pixmap_cache[key] = self._render_piece(
+                self.next_piece_index, ratio
+            )
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
 
 
 class GameBoard(QFrame):
-    update_score_signal = Signal(int)
-    update_level_signal = Signal(int)
-    update_rows_signal = Signal(int)
+    update_stats_signal = Signal(int, int, int)  # score, level, rows cleared
     game_over_signal = Signal()
     next_piece_ready_signal = Signal(int)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(BOARD_WIDTH_PX, BOARD_HEIGHT_PX)
-        # self.setStyleSheet("background-color: #DDDDDD; border: 1px solid black;") # Old light grey
-        self.setStyleSheet(
-            "background-color: #1C1C1C; border: 1px solid #444444;"
-        )  # New dark grey background, slightly lighter border
+        # Background and border are painted into the board pixmap, which
+        # covers the whole widget, so Qt need not clear it before each paint
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
-        self.board_state = []
+        # One 16-bit mask per row, bit x set if column x is filled
+        self.row_masks = array.array("H", [0]) * BOARD_HEIGHT_BLOCKS
+        # Shape index per cell, one flat buffer in row-major order (y * W + x)
+        self.board_state = bytearray(BOARD_WIDTH_BLOCKS * BOARD_HEIGHT_BLOCKS)
+        # Topmost filled row per column (height if empty)
+        self.col_heights = [BOARD_HEIGHT_BLOCKS] * BOARD_WIDTH_BLOCKS
         self.current_piece_shape_index = -1
-        self.current_piece_coords = []
-        self.current_pos = QPoint(0, 0)
+        self.current_piece_cells = ()  # (x, y) board cells of the falling piece
+        self.current_pos = (0, 0)  # Board cell of the piece's pivot
+        self.current_rotation = 0  # Index into PIECE_ROTATIONS for the piece
+        self._shadow_cells = None  # Cached shadow, None when it needs recomputing
+        self._piece_rects = ((), [])  # (piece cells, their paint rects)
+        self._shadow_rects = ((), [])  # (shadow cells, their paint rects)
         self.next_piece_shape_index = -1
         self.is_started = False
         self.is_paused = False
@@ -127,32 +355,39 @@ class GameBoard(QFrame):
         self.level = 0
         self.rows_cleared_total = 0
         self.piece_stats = {}
+        self._last_stats = None  # (score, level, rows) as last emitted
+        self._board_pixmap = QPixmap()  # Settled blocks, rebuilt only on change
+        self._board_pixmap_dirty = True  # Rebuild the pixmap on the next paint
+        self._rng = random.Random()
+        self._piece_bag = []  # Shuffled shape indices still to be dealt
 
         self.reset_board()
 
-    def get_color_for_index(self, index):
-        if 1 <= index <= len(TETRIS_COLORS):
-            return TETRIS_COLORS[index - 1]
-        return QColor("black")
+    def cell(self, x, y):
+        """Returns the shape index at board cell (x, y), NO_BLOCK if empty."""
+        return self.board_state[y * BOARD_WIDTH_BLOCKS + x]
 
     def reset_board(self):
-        self.board_state = [
-            [NO_BLOCK for _ in range(BOARD_WIDTH_BLOCKS)]
-            for _ in range(BOARD_HEIGHT_BLOCKS)
-        ]
-        self.current_piece_coords = []
+        # Clear the board buffers in place instead of allocating new ones
+        self.board_state[:] = EMPTY_BOARD_STATE
+        for y in range(BOARD_HEIGHT_BLOCKS):
+            self.row_masks[y] = 0
+        for x in range(BOARD_WIDTH_BLOCKS):
+            self.col_heights[x] = BOARD_HEIGHT_BLOCKS
+        self.current_piece_cells = ()
+        self._shadow_cells = None
         self.current_piece_shape_index = -1
-        self.next_piece_shape_index = random.randint(1, len(TETRIS_SHAPES))
+        self._piece_bag = []
+        self.next_piece_shape_index = self._next_piece_index()
         self.piece_stats = {i: 0 for i in range(1, len(TETRIS_SHAPES) + 1)}
         self.is_started = False
         self.is_paused = False
         self.score = 0
         self.level = 0
         self.rows_cleared_total = 0
-        self.update_score_signal.emit(self.score)
-        self.update_level_signal.emit(self.level)
-        self.update_rows_signal.emit(self.rows_cleared_total)
+        self._emit_stats()
         self.next_piece_ready_signal.emit(self.next_piece_shape_index)
+        self._board_pixmap_dirty = True
         self.update()
 
     def start_game(self):
@@ -166,79 +401,129 @@ class GameBoard(QFrame):
         if not self.is_started or self.is_paused:
             return
         self.is_paused = True
-        self.update()
+        # Nothing on the board looks different while paused, so no repaint
 
     def resume_game(self):
         if not self.is_started or not self.is_paused:
             return
         self.is_paused = False
         self.setFocus()
-        self.update()
 
     def create_new_piece(self):
         self.current_piece_shape_index = self.next_piece_shape_index
         if self.current_piece_shape_index != -1:
             self.piece_stats[self.current_piece_shape_index] += 1
-        shape_coords = TETRIS_SHAPES[self.current_piece_shape_index - 1]
-        self.current_pos = QPoint(BOARD_WIDTH_BLOCKS // 2, 1)
-        self.current_piece_coords = []
-        for point_offset in shape_coords:
-            coord = QPoint(
-                self.current_pos.x() + point_offset[0],
-                self.current_pos.y() + point_offset[1],
-            )
-            self.current_piece_coords.append(coord)
+        self.current_pos = (BOARD_WIDTH_BLOCKS // 2, 1)
+        self.current_rotation = 0
+        self.current_piece_cells = self._piece_cells(
+            *self.current_pos, self.current_rotation
+        )
+        self._shadow_cells = None
 
-        self.next_piece_shape_index = random.randint(1, len(TETRIS_SHAPES))
+        self.next_piece_shape_index = self._next_piece_index()
         self.next_piece_ready_signal.emit(self.next_piece_shape_index)
 
-        if not self.check_collision(self.current_piece_coords):
+        if not self.check_collision(*self.current_pos, self.current_rotation):
             self.is_started = False
-            self.current_piece_coords = []
+            self.current_piece_cells = ()
             self.game_over_signal.emit()
-        self.update()
+        self.update(self._piece_dirty_region())
+
+    def _next_piece_index(self):
+        """Deals shape indices from a shuffled bag holding each shape once."""
+        if not self._piece_bag:
+            self._piece_bag = list(range(1, len(TETRIS_SHAPES) + 1))
+            self._rng.shuffle(self._piece_bag)
+        return self._piece_bag.pop()
+
+    def _emit_stats(self):
+        """Emits update_stats_signal, unless the values are unchanged."""
+        stats = (self.score, self.level, self.rows_cleared_total)
+        if stats != self._last_stats:
+            self._last_stats = stats
+            self.update_stats_signal.emit(*stats)
 
     def get_stats(self):
         return self.piece_stats
 
-    def check_collision(self, piece_coords):
-        for point in piece_coords:
-            x = point.x()
-            y = point.y()
-            if x < 0 or x >= BOARD_WIDTH_BLOCKS or y < 0 or y >= BOARD_HEIGHT_BLOCKS:
-                return False
-            if 0 <= y < BOARD_HEIGHT_BLOCKS and self.board_state[y][x] != NO_BLOCK:
-                return False
-        return True
+    def _piece_cells(self, x, y, rotation):
+        """Returns the board cells of the current piece with its pivot at (x, y)."""
+        offsets = PIECE_ROTATIONS[self.current_piece_shape_index - 1][rotation]
+        return tuple((x + dx, y + dy) for dx, dy in offsets)
+
+    def _piece_dirty_region(self):
+        """Returns the widget area covered by the falling piece and its shadow.
+
+        The two are kept as separate rects so the empty rows between them
+        are not repainted.
+        """
+        if not self.current_piece_cells:
+            return QRegion()
+        x, y = self.current_pos
+        region = QRegion(self._piece_rect(x, y, self.current_rotation))
+        if self.show_shadow:
+            shadow_y = y + self.shadow_cells()[0][1] - self.current_piece_cells[0][1]
+            region = region.united(
+                QRegion(self._piece_rect(x, shadow_y, self.current_rotation))
+            )
+        return region
+
+    def _piece_rect(self, x, y, rotation):
+        """Returns the pixel bounding box of the current piece pivoted at (x, y)."""
+        bounds = PIECE_PIXEL_BOUNDS[self.current_piece_shape_index - 1][rotation]
+        return bounds.translated(x * BLOCK_SIZE_PX, y * BLOCK_SIZE_PX)
+
+    def check_collision(self, x, y, rotation):
+        """Returns True if the current piece fits with its pivot at (x, y)."""
+        # Every shape contains its pivot, so a pivot off the board never fits
+        if x < 0 or x >= BOARD_WIDTH_BLOCKS:
+            return False
+        piece_rows = PIECE_ROW_MASKS[self.current_piece_shape_index - 1][rotation][x]
+        if piece_rows is None:
+            return False
+        return _piece_rows_fit(self.row_masks, piece_rows, y)
 
     def move_piece(self, dx, dy):
-        if not self.current_piece_coords or self.is_paused:
+        if not self.current_piece_cells or self.is_paused:
             return False
-        new_coords = [QPoint(p.x() + dx, p.y() + dy) for p in self.current_piece_coords]
-        if self.check_collision(new_coords):
-            self.current_piece_coords = new_coords
-            self.current_pos += QPoint(dx, dy)
-            self.update()
+        x, y = self.current_pos
+        new_x = x + dx
+        new_y = y + dy
+        if self.check_collision(new_x, new_y, self.current_rotation):
+            dirty_region = self._piece_dirty_region()
+            self.current_piece_cells = self._piece_cells(
+                new_x, new_y, self.current_rotation
+            )
+            self._shadow_cells = None
+            self.current_pos = (new_x, new_y)
+            self.update(dirty_region.united(self._piece_dirty_region()))
             return True
         else:
             return False
 
-    def rotate_piece(self):
-        if not self.current_piece_coords or self.is_paused:
-            return
-        if self.current_piece_shape_index == 1:
-            return
-        pivot = self.current_pos
-        new_coords = []
-        for point in self.current_piece_coords:
-            rel_x = point.x() - pivot.x()
-            rel_y = point.y() - pivot.y()
-            new_rel_x = -rel_y
-            new_rel_y = rel_x
-            new_coords.append(QPoint(pivot.x() + new_rel_x, pivot.y() + new_rel_y))
-        if self.check_collision(new_coords):
-            self.current_piece_coords = new_coords
-            self.update()
+    def rotate_piece(self, direction=1):
+        """Rotates clockwise for direction 1, counter-clockwise for -1."""
+        # Like move_piece, a blocked rotation returns False without a repaint
+        if not self.current_piece_cells or self.is_paused:
+            return False
+        rotations = PIECE_ROTATIONS[self.current_piece_shape_index - 1]
+        if len(rotations) == 1:
+            return False
+        new_rotation = (self.current_rotation + direction) % len(rotations)
+        x, y = self.current_pos
+        # The first kick is (0, 0), the plain rotation in place
+        for kick_x, kick_y in PIECE_KICKS[self.current_piece_shape_index - 1]:
+            new_x = x + kick_x
+            new_y = y + kick_y
+            if self.check_collision(new_x, new_y, new_rotation):
+                dirty_region = self._piece_dirty_region()
+                self.current_rotation = new_rotation
+                self.current_pos = (new_x, new_y)
+                self.current_piece_cells = self._piece_cells(new_x, new_y, new_rotation)
+                self._shadow_cells = None
+                self.update(dirty_region.united(self._piece_dirty_region()))
+                return True
+        return False
 
     def slide_down(self):
         if not self.move_piece(0, 1):
@@ -247,46 +532,57 @@ class GameBoard(QFrame):
         return True
 
     def drop_piece(self):
-        if not self.current_piece_coords or self.is_paused:
+        if not self.current_piece_cells or self.is_paused:
             return
         # Calculate final position directly using shadow logic helper
-        shadow_coords = self._calculate_shadow_position()
-        if shadow_coords:
+        shadow_cells = self.shadow_cells()
+        if shadow_cells:
+            dirty_region = self._piece_dirty_region()
             # Update current piece position and cement it
-            dy = shadow_coords[0].y() - self.current_piece_coords[0].y()
-            self.current_pos += QPoint(0, dy)
-            self.current_piece_coords = shadow_coords
+            dy = shadow_cells[0][1] - self.current_piece_cells[0][1]
+            self.current_pos = (self.current_pos[0], self.current_pos[1] + dy)
+            self.current_piece_cells = shadow_cells
             self.cement_piece()  # Cement immediately after dropping
-            self.update()
+            self.update(dirty_region)
 
     def cement_piece(self):
-        if not self.current_piece_coords:
+        if not self.current_piece_cells:
             return
-        for point in self.current_piece_coords:
-            if (
-                0 <= point.y() < BOARD_HEIGHT_BLOCKS
-                and 0 <= point.x() < BOARD_WIDTH_BLOCKS
-            ):
-                self.board_state[point.y()][point.x()] = self.current_piece_shape_index
-        self.clear_lines()
-
-        self.current_piece_coords = []
+        dirty_region = self._piece_dirty_region()
+        # OR in the piece's precomputed row masks, one per row it covers
+        pivot_x, pivot_y = self.current_pos
+        piece_rows = PIECE_ROW_MASKS[self.current_piece_shape_index - 1][
+            self.current_rotation
+        ][pivot_x]
+        for dy, mask in piece_rows:
+            self.row_masks[pivot_y + dy] |= mask
+        for x, y in self.current_piece_cells:
+            self.board_state[y * BOARD_WIDTH_BLOCKS + x] = (
+                self.current_piece_shape_index
+            )
+            if y < self.col_heights[x]:
+                self.col_heights[x] = y
+        # Only rows the piece landed in can have just filled up; piece_rows
+        # is sorted by dy, so its ends are the top and bottom rows
+        self.clear_lines(
+            pivot_y + piece_rows[0][0], pivot_y + piece_rows[-1][0]
+        )  # Repaints the whole board if any rows went
+        self._board_pixmap_dirty = True
+        self.update(dirty_region)
+
+        self.current_piece_cells = ()
+        self._shadow_cells = None
         self.current_piece_shape_index = -1
 
         if self.is_started:
             self.create_new_piece()
-        # No need for another self.update() here, create_new_piece calls it.
 
-    def clear_lines(self):
-        lines_to_clear = []
-        for y in range(BOARD_HEIGHT_BLOCKS):
-            if all(
-                self.board_state[y][x] != NO_BLOCK for x in range(BOARD_WIDTH_BLOCKS)
-            ):
-                lines_to_clear.append(y)
-        if not lines_to_clear:
+    def clear_lines(self, top_y=0, bottom_y=BOARD_HEIGHT_BLOCKS - 1):
+        """Clears the full rows between top_y and bottom_y, inclusive."""
+        # count runs the full-row compare over the band in one C loop
+        num_cleared = self.row_masks[top_y : bottom_y + 1].count(FULL_ROW_MASK)
+        if not num_cleared:
             return
-        num_cleared = len(lines_to_clear)
         self.rows_cleared_total += num_cleared
         score_gain = num_cleared * num_cleared * (self.level + 1) * 10
         self.score += score_gain
@@ -294,94 +590,153 @@ class GameBoard(QFrame):
         if new_level > self.level:
             self.level = new_level
 
-        # Rebuild board state instead of shifting
-        new_board_state = [
-            [NO_BLOCK for _ in range(BOARD_WIDTH_BLOCKS)]
-            for _ in range(BOARD_HEIGHT_BLOCKS)
-        ]
-
-        new_row_index = BOARD_HEIGHT_BLOCKS - 1
-        for old_row_index in range(BOARD_HEIGHT_BLOCKS - 1, -1, -1):
-            if old_row_index not in lines_to_clear:
-                if new_row_index >= 0:
-                    new_board_state[new_row_index] = list(
-                        self.board_state[old_row_index]
-                    )
-                    new_row_index -= 1
-
-        self.board_state = new_board_state
-
-        self.update_score_signal.emit(self.score)
-        self.update_level_signal.emit(self.level)
-        self.update_rows_signal.emit(self.rows_cleared_total)
-        # self.update()
-        self.repaint()  # Hopefully making the widget redraw iself immediately and synchronously before the clear_lines function returns
+        _drop_full_rows(self.row_masks, self.board_state, num_cleared, top_y)
+        self._recompute_col_heights()
+
+        self._emit_stats()
+        self.update()
+
+    def _recompute_col_heights(self):
+        """Rebuilds col_heights by scanning the row masks top down.
+
+        The board is stored row-major (one mask per row), so this walks rows
+        rather than columns and stops once every column has been seen.
+        """
+        col_heights = [BOARD_HEIGHT_BLOCKS] * BOARD_WIDTH_BLOCKS
+        unseen = FULL_ROW_MASK
+        for y, row_mask in enumerate(self.row_masks):
+            hit = row_mask & unseen
+            while hit:
+                bit = hit & -hit
+                col_heights[bit.bit_length() - 1] = y
+                hit ^= bit
+            unseen &= ~row_mask
+            if not unseen:
+                break
+        self.col_heights = col_heights
+
+    def shadow_cells(self):
+        """Returns the shadow cells, recomputing them only after a change."""
+        if self._shadow_cells is None:
+            self._shadow_cells = self._calculate_shadow_position()
+        return self._shadow_cells
 
     def _calculate_shadow_position(self):
         """Finds the lowest valid position for the current piece."""
-        if not self.current_piece_coords:
-            return []
-
-        shadow_coords = list(self.current_piece_coords)  # Start with current pos
-        dy = 0
-        while True:
-            dy += 1
-            potential_coords = [
-                QPoint(p.x(), p.y() + dy) for p in self.current_piece_coords
-            ]
-            if not self.check_collision(potential_coords):
-                dy -= 1  # Last valid position was one step above
-                break
-        # Return the coordinates at the final valid position
-        return [QPoint(p.x(), p.y() + dy) for p in self.current_piece_coords]
+        if not self.current_piece_cells:
+            return ()
+
+        x, y = self.current_pos
+        rotation = self.current_rotation
+        bottoms = PIECE_BOTTOM_OFFSETS[self.current_piece_shape_index - 1][rotation]
+        col_heights = self.col_heights
+        drop = min(
+            col_heights[x + dx] - (y + bottom_dy) - 1 for dx, bottom_dy in bottoms
+        )
+        if drop < 0:
+            # Piece is tucked under an overhang, so the heights don't apply
+            piece_rows = PIECE_ROW_MASKS[self.current_piece_shape_index - 1][rotation]
+            drop = _drop_distance(self.row_masks, piece_rows[x], y)
+        # Return the cells at the final valid position
+        return self._piece_cells(x, y + drop, rotation)
+
+    def _rebuild_board_pixmap(self):
+        """Renders the settled blocks into the cached board pixmap."""
+        ratio = self.devicePixelRatioF()
+        if (
+            self._board_pixmap.isNull()
+            or self._board_pixmap.devicePixelRatio() != ratio
+        ):
+            self._board_pixmap = QPixmap(
+                int(BOARD_WIDTH_PX * ratio), int(BOARD_HEIGHT_PX * ratio)
+            )
+            self._board_pixmap.setDevicePixelRatio(ratio)
+        self._board_pixmap.fill(BOARD_BACKGROUND_COLOR)
+
+        painter = QPainter(self._board_pixmap)
+        painter.setPen(BOARD_BORDER_PEN)
+        painter.drawRect(0, 0, BOARD_WIDTH_PX - 1, BOARD_HEIGHT_PX - 1)
+
+        # Bucket cells by color so each color is one drawRects call
+        # Only the set bits of each row mask are visited, empty cells never are,
+        # and the empty rows above the stack are skipped altogether
+        rects_by_color = [[] for _ in TETRIS_COLORS]
+        # Locals for the inner loop, which runs once per settled block
+        block_size = BLOCK_SIZE_PX
+        rect_size = BLOCK_SIZE_PX - 1
+        width = BOARD_WIDTH_BLOCKS
+        row_masks = self.row_masks
+        board_state = self.board_state
+        make_rect = QRect
+        for y in range(min(self.col_heights), BOARD_HEIGHT_BLOCKS):
+            row_mask = row_masks[y]
+            row_start = y * width
+            rect_y = y * block_size
+            while row_mask:
+                bit = row_mask & -row_mask
+                row_mask ^= bit
+                x = bit.bit_length() - 1
+                rects_by_color[board_state[row_start + x] - 1].append(
+                    make_rect(x * block_size, rect_y, rect_size, rect_size)
+                )
+        for i, rects in enumerate(rects_by_color):
+            if rects:
+                painter.setBrush(TETRIS_BRUSHES[i])
+                painter.setPen(TETRIS_BORDER_PENS[i])
+                painter.drawRects(rects)
+        painter.end()
+        self._board_pixmap_dirty = False
 
     def paintEvent(self, event):
+        if self._board_pixmap_dirty:
+            self._rebuild_board_pixmap()
+
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Draw Fallen Pieces
-        for y in range(BOARD_HEIGHT_BLOCKS):
-            for x in range(BOARD_WIDTH_BLOCKS):
-                block_index = self.board_state[y][x]
-                if block_index != NO_BLOCK:
-                    color = self.get_color_for_index(block_index)
-                    rect_x = x * BLOCK_SIZE_PX
-                    rect_y = y * BLOCK_SIZE_PX
-                    painter.fillRect(
-                        rect_x, rect_y, BLOCK_SIZE_PX, BLOCK_SIZE_PX, color
-                    )
-                    painter.setPen(color.darker(120))
-                    painter.drawRect(
-                        rect_x, rect_y, BLOCK_SIZE_PX - 1, BLOCK_SIZE_PX - 1
-                    )
-
-        # Draw Shadow Piece (if enabled and piece exists)
-        if self.show_shadow and self.current_piece_coords:
-            shadow_coords = self._calculate_shadow_position()
-            if shadow_coords:
-                color = self.get_color_for_index(self.current_piece_shape_index)
+        # Draw Fallen Pieces from the cache; the painter is already clipped to
+        # event.rect(), so a partial update only blits the dirty area
+        painter.drawPixmap(0, 0, self._board_pixmap)
+
+        piece_cells = self.current_piece_cells
+        if not piece_cells:
+            return
+        color_index = self.current_piece_shape_index - 1
+        block_size = BLOCK_SIZE_PX  # Local for the rect comprehensions below
+
+        # Draw Shadow Piece (if enabled)
+        if self.show_shadow:
+            shadow_cells = self.shadow_cells()
+            if shadow_cells:
+                # The rects are reused until shadow_cells() hands back a new tuple
+                if self._shadow_rects[0] is not shadow_cells:
+                    inset_size = block_size - 2
+                    rects = [
+                        QRect(
+                            x * block_size + 1,
+                            y * block_size + 1,
+                            inset_size,
+                            inset_size,
+                        )  # Inset slightly
+                        for x, y in shadow_cells
+                    ]
+                    self._shadow_rects = (shadow_cells, rects)
                 # Use a more transparent / outline style for shadow
-                shadow_pen = QPen(color.darker(110), 1)
-                shadow_brush = QBrush(Qt.BrushStyle.NoBrush)  # No fill
-                painter.setPen(shadow_pen)
-                painter.setBrush(shadow_brush)
-                for point in shadow_coords:
-                    rect_x = point.x() * BLOCK_SIZE_PX
-                    rect_y = point.y() * BLOCK_SIZE_PX
-                    painter.drawRect(
-                        rect_x + 1, rect_y + 1, BLOCK_SIZE_PX - 2, BLOCK_SIZE_PX - 2
-                    )  # Inset slightly
-
-        # Draw Current Piece (on top of shadow)
-        if self.current_piece_coords:
-            color = self.get_color_for_index(self.current_piece_shape_index)
-            painter.setBrush(QBrush(color))  # Set brush for fill
-            painter.setPen(color.darker(120))  # Keep border
-            for point in self.current_piece_coords:
-                rect_x = point.x() * BLOCK_SIZE_PX
-                rect_y = point.y() * BLOCK_SIZE_PX
-                painter.fillRect(rect_x, rect_y, BLOCK_SIZE_PX, BLOCK_SIZE_PX, color)
-                painter.drawRect(rect_x, rect_y, BLOCK_SIZE_PX - 1, BLOCK_SIZE_PX - 1)
+                painter.setPen(TETRIS_SHADOW_PENS[color_index])
+                painter.setBrush(Qt.BrushStyle.NoBrush)  # No fill
+                painter.drawRects(self._shadow_rects[1])
+
+        # Draw Current Piece (on top of shadow), reusing its rects like the
+        # shadow's until the piece moves; gravity only moves it every interval
+        if self._piece_rects[0] is not piece_cells:
+            rect_size = block_size - 1
+            rects = [
+                QRect(x * block_size, y * block_size, rect_size, rect_size)
+                for x, y in piece_cells
+            ]
+            self._piece_rects = (piece_cells, rects)
+        painter.setBrush(TETRIS_BRUSHES[color_index])
+        painter.setPen(TETRIS_BORDER_PENS[color_index])
+        painter.drawRects(self._piece_rects[1])
 
 
 class OptionsDialog(QDialog):
@@ -442,18 +797,24 @@ class OptionsDialog(QDialog):
 
     @Slot()
     def show_multiplayer(self):
-        print("Multiplayer button clicked - not implemented yet")
+        if __debug__ and DEBUG_TRACE:
+            print("Multiplayer button clicked - not implemented yet")
 
     @Slot()
     def show_gametypes(self):
-        print("Game Types button clicked - not implemented yet")
+        if __debug__ and DEBUG_TRACE:
+            print("Game Types button clicked - not implemented yet")
 
     @Slot()
     def show_about(self):
-        print("About button clicked - not implemented yet")
+        if __debug__ and DEBUG_TRACE:
+            print("About button clicked - not implemented yet")
 
 
 class PieceDisplayWidget(QWidget):
+    # Rendered piece per (shape index, device pixel ratio), shared by all dialogs
+    _pixmap_cache = {}
+
     def __init__(self, shape_index, parent=None):
         super().__init__(parent)
         self.shape_index = shape_index
@@ -462,20 +823,17 @@ class PieceDisplayWidget(QWidget):
         height = NEXT_PIECE_AREA_HEIGHT_BLOCKS * self.block_size
         self.setFixedSize(int(width), int(height))
 
-    def paintEvent(self, event):
-        if not (1 <= self.shape_index <= len(TETRIS_SHAPES)):
-            return
+    def _render_piece(self, ratio):
+        """Draws the piece, centered, into a transparent pixmap the widget's size."""
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter = QPainter(pixmap)
 
         shape_coords_rel = TETRIS_SHAPES[self.shape_index - 1]
-        color = TETRIS_COLORS[self.shape_index - 1]
 
-        min_x = min(p[0] for p in shape_coords_rel)
-        max_x = max(p[0] for p in shape_coords_rel)
-        min_y = min(p[1] for p in shape_coords_rel)
-        max_y = max(p[1] for p in shape_coords_rel)
+        min_x, max_x, min_y, max_y = SHAPE_BBOX[self.shape_index - 1]
         piece_width_blocks = max_x - min_x + 1
         piece_height_blocks = max_y - min_y + 1
 
@@ -484,18 +842,36 @@ class PieceDisplayWidget(QWidget):
         offset_x_px = -min_x * self.block_size
         offset_y_px = -min_y * self.block_size
 
-        painter.setPen(color.darker(120))
-        painter.setBrush(QBrush(color))
-
-        for point_offset in shape_coords_rel:
-            rect_x = start_x_px + offset_x_px + point_offset[0] * self.block_size
-            rect_y = start_y_px + offset_y_px + point_offset[1] * self.block_size
-            painter.drawRect(
-                int(rect_x),
-                int(rect_y),
-                int(self.block_size - 1),
-                int(self.block_size - 1),
-            )
+        painter.setPen(TETRIS_BORDER_PENS[self.shape_index - 1])
+        painter.setBrush(TETRIS_BRUSHES[self.shape_index - 1])
+
+        rect_size = int(self.block_size - 1)
+        painter.drawRects(
+            [
+                QRect(
+                    int(start_x_px + offset_x_px + point_offset[0] * self.block_size),
+                    int(start_y_px + offset_y_px + point_offset[1] * self.block_size),
+                    rect_size,
+                    rect_size,
+                )
+                for point_offset in shape_coords_rel
+            ]
+        )
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        if not (1 <= self.shape_index <= len(TETRIS_SHAPES)):
+            return
+
+        ratio = self.devicePixelRatioF()
+        key = (self.shape_index, ratio)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = self._pixmap_cache[key] = self._render_piece(ratio)
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
 
 
 class StatsDialog(QDialog):
@@ -558,16 +934,7 @@ class KeysDialog(QDialog):
                 Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
             )
 
-            key_sequence = QKeySequence(qt_key_code)
-            key_str = key_sequence.toString(QKeySequence.SequenceFormat.NativeText)
-            # Optional: Handle cases where NativeText might still be empty for some obscure keys
-            if not key_str:
-                # Fallback to portable text or just the key code if needed
-                key_str = key_sequence.toString(
-                    QKeySequence.SequenceFormat.PortableText
-                )
-                if not key_str:
-                    key_str = f"Code: {qt_key_code}"  # Absolute fallback
+            key_str = _key_to_str(qt_key_code)
 
             key_display = QLineEdit(key_str)  # Display the key string
             key_display.setReadOnly(True)
@@ -592,7 +959,9 @@ class MainWindow(QMainWindow):
         super().__init__(parent)
         self.setWindowTitle(f"PySide6 Tetris (from Tcl)")
         self.game_state = "Init"
-        self.current_interval = 500
+        self.current_interval = 500  # Milliseconds per gravity step
+        self._last_tick_ns = time.monotonic_ns()
+        self._fall_accum_ns = 0  # Nanoseconds of gravity not yet applied
 
         self.key_bindings = {
             "Left": Qt.Key.Key_Left,
@@ -606,6 +975,9 @@ class MainWindow(QMainWindow):
             "Options": Qt.Key.Key_O,
         }
         self.fall_timer = QTimer(self)
+        # Frame ticks should land on a steady 16 ms cadence, not drift by the
+        # coarse timer's 5% slack; gravity itself runs off elapsed time
+        self.fall_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.fall_timer.timeout.connect(self.game_step)
         central_widget = QWidget()
         main_layout = QHBoxLayout(central_widget)
@@ -615,7 +987,10 @@ class MainWindow(QMainWindow):
         self.title_label = QLabel(f"Tetris v?.? (PySide6)")
         self.next_piece_label = QLabel("Next Object")
         self.next_piece_display = NextPieceWidget()
-        info_layout = QGridLayout()
+        # Own widget for the stats, so a stats update repaints just this box
+        self.stats_panel = QWidget()
+        info_layout = QGridLayout(self.stats_panel)
+        info_layout.setContentsMargins(0, 0, 0, 0)
         self.score_label = QLabel("Score:")
         self.score_value = QLabel("0")
         self.level_label = QLabel("Level:")
@@ -637,7 +1012,7 @@ class MainWindow(QMainWindow):
         left_layout.addWidget(
             self.next_piece_display, alignment=Qt.AlignmentFlag.AlignCenter
         )  # Add widget
-        left_layout.addLayout(info_layout)
+        left_layout.addWidget(self.stats_panel)
         left_layout.addWidget(self.start_pause_button)
         left_layout.addWidget(self.reset_button)
         left_layout.addWidget(self.options_button)
@@ -660,9 +1035,7 @@ class MainWindow(QMainWindow):
         self.reset_button.clicked.connect(self.reset_game)
         self.quit_button.clicked.connect(QApplication.instance().quit)
         self.options_button.clicked.connect(self.show_options_dialog)
-        self.game_board.update_score_signal.connect(self.update_score_display)
-        self.game_board.update_level_signal.connect(self.update_level_display)
-        self.game_board.update_rows_signal.connect(self.update_rows_display)
+        self.game_board.update_stats_signal.connect(self.update_stats_display)
         self.game_board.game_over_signal.connect(self.handle_game_over)
         # Connect GameBoard signal to NextPieceWidget slot
         self.game_board.next_piece_ready_signal.connect(
@@ -671,33 +1044,47 @@ class MainWindow(QMainWindow):
 
         self.options_dialog = None
 
+        self._build_key_actions()
+
         self.reset_game()
 
+    def _build_key_actions(self):
+        """Maps bound key codes to actions, so a keypress is one dict lookup.
+
+        Call again after changing key_bindings.
+        """
+        board = self.game_board
+        bindings = self.key_bindings
+        # While playing
+        self._key_actions = {
+            int(bindings["Left"]): lambda: board.move_piece(-1, 0),
+            int(bindings["Right"]): lambda: board.move_piece(1, 0),
+            int(bindings["Rotate Left"]): lambda: board.rotate_piece(-1),
+            int(bindings["Rotate Right"]): board.rotate_piece,
+            int(bindings["Slide"]): board.slide_down,
+            int(bindings["Drop"]): board.drop_piece,
+            int(bindings["Start/Pause"]): self.toggle_game_state,
+            int(bindings["Reset"]): self.reset_game,
+        }
+        # While not started, paused or over
+        self._idle_key_actions = {
+            int(bindings["Options"]): self.show_options_dialog,
+            int(bindings["Start/Pause"]): self.toggle_game_state,
+            int(bindings["Reset"]): self.reset_game,
+        }
+
     def keyPressEvent(self, event):
         if self.game_state != "Playing" or self.game_board.is_paused:
-            if event.key() == self.key_bindings.get("Options"):
-                self.show_options_dialog()
+            action = self._idle_key_actions.get(event.key())
+            if action is not None:
+                action()
             else:
                 event.ignore()
             return
 
-        key = event.key()
-        board = self.game_board
-
-        if key == self.key_bindings.get("Left"):
-            board.move_piece(-1, 0)
-        elif key == self.key_bindings.get("Right"):
-            board.move_piece(1, 0)
-        elif key == self.key_bindings.get("Rotate Left"):
-            board.rotate_piece()
-        elif key == self.key_bindings.get("Slide"):
-            board.slide_down()
-        elif key == self.key_bindings.get("Drop"):
-            board.drop_piece()
-        elif key == self.key_bindings.get("Start/Pause"):
-            self.toggle_game_state()
-        elif key == self.key_bindings.get("Reset"):
-            self.reset_game()
+        action = self._key_actions.get(event.key())
+        if action is not None:
+            action()
         else:
             super().keyPressEvent(event)
 
@@ -708,8 +1095,25 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def game_step(self):
-        if self.game_state == "Playing" and not self.game_board.is_paused:
-            self.game_board.slide_down()
+        now = time.monotonic_ns()
+        self._fall_accum_ns += now - self._last_tick_ns
+        self._last_tick_ns = now
+        # Integer nanoseconds, so the leftover never drifts from rounding
+        steps, self._fall_accum_ns = divmod(
+            self._fall_accum_ns, self.current_interval * 1_000_000
+        )
+        # Catch up on every gravity step that came due since the last tick.
+        # Each step only marks its rects dirty; Qt paints them all at once.
+        board = self.game_board
+        for _ in range(steps):
+            if self.game_state != "Playing" or board.is_paused:
+                break
+            board.slide_down()
+
+    def start_fall_timer(self):
+        self._last_tick_ns = time.monotonic_ns()
+        self._fall_accum_ns = 0
+        self.fall_timer.start(FRAME_INTERVAL_MS)
 
     @Slot()
     def toggle_game_state(self):
@@ -719,7 +1123,7 @@ class MainWindow(QMainWindow):
             self.start_pause_button.setText("Pause")
             self.update_timer_interval()
             self.game_board.start_game()  # This now sets up first piece AND next piece
-            self.fall_timer.start(self.current_interval)
+            self.start_fall_timer()
         elif self.game_state == "Playing":
             # Pause the game
             self.game_state = "Paused"
@@ -731,7 +1135,7 @@ class MainWindow(QMainWindow):
             self.game_state = "Playing"
             self.start_pause_button.setText("Pause")
             self.game_board.resume_game()
-            self.fall_timer.start(self.current_interval)
+            self.start_fall_timer()
 
     @Slot()
     def reset_game(self):
@@ -745,47 +1149,24 @@ class MainWindow(QMainWindow):
         self.fall_timer.stop()
         self.game_state = "GameOver"
         self.start_pause_button.setText("Game Over")
-        print("Game Over!")
+        if __debug__ and DEBUG_TRACE:
+            print("Game Over!")
 
-    @Slot(int)
-    def update_score_display(self, score):
+    @Slot(int, int, int)
+    def update_stats_display(self, score, level, rows):
+        # Hold repaints until all three labels are set, then repaint once
+        self.stats_panel.setUpdatesEnabled(False)
         self.score_value.setText(str(score))
-
-    @Slot(int)
-    def update_level_display(self, level):
         self.level_value.setText(str(level))
-        self.update_timer_interval()
-
-    @Slot(int)
-    def update_rows_display(self, rows):
         self.rows_value.setText(str(rows))
+        self.stats_panel.setUpdatesEnabled(True)
+        self.update_timer_interval()
 
     def update_timer_interval(self):
         base_interval = 500
         level_factor = base_interval / 20
         new_interval = base_interval - (level_factor * self.game_board.level)
         self.current_interval = max(50, int(new_interval))
-        if self.fall_timer.isActive():
-            self.fall_timer.setInterval(self.current_interval)
-
-    def keyPressEvent(self, event):
-        if self.game_state != "Playing" or self.game_board.is_paused:
-            event.ignore()
-            return
-        key = event.key()
-        board = self.game_board
-        if key == Qt.Key.Key_Left:
-            board.move_piece(-1, 0)
-        elif key == Qt.Key.Key_Right:
-            board.move_piece(1, 0)
-        elif key == Qt.Key.Key_Up:
-            board.rotate_piece()
-        elif key == Qt.Key.Key_Down:
-            board.slide_down()
-        elif key == Qt.Key.Key_Space:
-            board.drop_piece()
-        else:
-            super().keyPressEvent(event)
 
 
 if __name__ == "__main__":
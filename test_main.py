@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+import main  # noqa: E402
+
+L_SHAPE = 4
+J_SHAPE = 5
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def _place(board, shape_index, x, y, rotation):
+    board.start_game()
+    board.current_piece_shape_index = shape_index
+    board.current_rotation = rotation
+    board.current_pos = (x, y)
+    board.current_piece_cells = board._piece_cells(x, y, rotation)
+
+
+def test_l_clockwise_kicks_off_left_wall(app):
+    board = main.GameBoard()
+    # Rotation 3 fills columns 0..1, rotation 0 needs the column left of x
+    _place(board, L_SHAPE, 0, 10, 3)
+    assert not board.check_collision(0, 10, 0)
+    assert board.rotate_piece()
+    assert board.current_rotation == 0
+    assert board.current_pos == (1, 10)
+
+
+def test_j_counter_clockwise_kicks_off_right_wall(app):
+    board = main.GameBoard()
+    right = main.BOARD_WIDTH_BLOCKS - 1
+    _place(board, J_SHAPE, right, 10, 1)
+    assert not board.check_collision(right, 10, 0)
+    assert board.rotate_piece(-1)
+    assert board.current_rotation == 0
+    assert board.current_pos == (right - 1, 10)